@@ -4,8 +4,9 @@ import sys
 
 import pygame
 
-from snake_app.constants import ASSETS_DIR, FOOD_COLOR, GRID_SIZE, HEIGHT, TEXT_COLOR, WIDTH
-from snake_app.models import Food, Leaderboard, Snake, SpecialFood
+from snake_app.assets import load_image, load_sound
+from snake_app.constants import ASSETS_DIR, GRID_SIZE, HEIGHT, TEXT_COLOR, WIDTH
+from snake_app.models import Food, Leaderboard, Snake, SpecialFood, advance_and_draw_particles
 from snake_app.screens import (
     countdown,
     game_over_screen,
@@ -16,77 +17,42 @@ from snake_app.screens import (
     username_input,
 )
 import snake_app.settings as settings
-from snake_app.ui import Button, draw_modern_background
+from snake_app.ui import Button, draw_modern_background, get_background, get_font
 
 
 pygame.init()
 pygame.mixer.init()
 
 
-def load_scaled_image(path, size):
-    """Load an image asset and scale it to target size."""
-    image = pygame.image.load(path).convert_alpha()
-    return pygame.transform.scale(image, size)
+EAT_CHANNEL = pygame.mixer.Channel(1)
+FAIL_CHANNEL = pygame.mixer.Channel(2)
 
+HEAD_ANGLES = (("RIGHT", 0), ("UP", 90), ("LEFT", 180), ("DOWN", -90))
 
-def load_game_assets():
-    """Load all gameplay images and sounds."""
-    snake_head_image = load_scaled_image(ASSETS_DIR / "snake_head.png", (GRID_SIZE, GRID_SIZE))
-    snake_body_image = load_scaled_image(ASSETS_DIR / "snake_body.png", (GRID_SIZE, GRID_SIZE))
-    food_image = load_scaled_image(ASSETS_DIR / "food.png", (GRID_SIZE, GRID_SIZE))
-    pause_image = load_scaled_image(ASSETS_DIR / "pause.png", (40, 40))
 
-    eat_sound = pygame.mixer.Sound(str(ASSETS_DIR / "eat.wav"))
+def load_game_assets():
+    """Fetch all gameplay images and sounds from the asset cache."""
+    snake_head_image = load_image("snake_head.png", (GRID_SIZE, GRID_SIZE))
+    rotated_heads = {
+        direction: pygame.transform.rotate(snake_head_image, angle).convert_alpha()
+        for direction, angle in HEAD_ANGLES
+    }
+    snake_body_image = load_image("snake_body.png", (GRID_SIZE, GRID_SIZE))
+    food_image = load_image("food.png", (GRID_SIZE, GRID_SIZE))
+    pause_image = load_image("pause.png", (40, 40))
+
+    eat_sound = load_sound("eat.wav")
     eat_sound.set_volume(settings.sound_volume)
-    fail_sound = pygame.mixer.Sound(str(ASSETS_DIR / "fail.wav"))
+    fail_sound = load_sound("fail.wav")
     fail_sound.set_volume(settings.sound_volume)
 
-    return snake_head_image, snake_body_image, food_image, pause_image, eat_sound, fail_sound
-
-
-def update_special_particles(special_particles):
-    """Advance and expire detached special food particles."""
-    for particle in special_particles[:]:
-        particle[0] += particle[2]
-        particle[1] += particle[3]
-        particle[4] -= 0.1
-        if particle[4] <= 0:
-            special_particles.remove(particle)
-
-
-def draw_food_particles(screen, particles):
-    """Draw food burst particles."""
-    for particle in particles:
-        pygame.draw.circle(screen, FOOD_COLOR, (int(particle[0]), int(particle[1])), int(particle[4]))
-
-
-def draw_snake(screen, snake, snake_head_image, snake_body_image):
-    """Draw rotated snake head plus body segments."""
-    angle = 0
-    if snake.direction == "UP":
-        angle = 90
-    elif snake.direction == "LEFT":
-        angle = 180
-    elif snake.direction == "DOWN":
-        angle = -90
-
-    rotated_head = pygame.transform.rotate(snake_head_image, angle)
-    screen.blit(rotated_head, (snake.head[0], snake.head[1]))
-    for segment in snake.body:
-        screen.blit(snake_body_image, (segment[0], segment[1]))
+    return rotated_heads, snake_body_image, food_image, pause_image, eat_sound, fail_sound
 
 
-def handle_game_over(screen, score, username):
-    """Store score, show decision screen, then route action."""
-    Leaderboard().add_score(username, score)
-    decision = game_over_screen(screen, score, username)
-    if decision == "main_menu":
-        main_menu()
-    elif decision == "restart":
-        run_game(username)
-    elif decision == "exit":
-        pygame.quit()
-        sys.exit()
+def draw_snake(screen, snake, rotated_heads, snake_body_image):
+    """Draw the pre-rotated snake head plus body segments."""
+    screen.blit(rotated_heads[snake.direction], (snake.head[0], snake.head[1]))
+    screen.blits([(snake_body_image, (segment[0], segment[1])) for segment in snake.body])
 
 
 def main_menu():
@@ -106,18 +72,27 @@ def main_menu():
         Button(WIDTH // 2 - 100, 420, 200, 50, "Quit", lambda: "quit"),
     ]
 
+    full_redraw = True
+
     while True:
         draw_modern_background(screen)
-        font = pygame.font.Font(None, 64)
+        font = get_font(64)
         title_surface = font.render("Snake Game", True, TEXT_COLOR)
         title_rect = title_surface.get_rect(center=(WIDTH // 2, 100))
         screen.blit(title_surface, title_rect)
 
         mouse_pos = pygame.mouse.get_pos()
+        dirty_rects = []
         for button in buttons:
             button.hovered = button.rect.collidepoint(mouse_pos)
+            previous_rect = button.rect.copy()
             button.draw(screen)
-        pygame.display.flip()
+            dirty_rects.append(previous_rect.union(button.rect))
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty_rects)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -125,13 +100,15 @@ def main_menu():
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
-                    if button.rect.collidepoint(event.pos):
+                    if button.hovered:
                         result = button.callback()
+                        full_redraw = True
                         if result == "start":
                             username = username_input(screen)
                             if username == "back":
                                 continue
                             run_game(username)
+                            pygame.mixer.music.play(-1)
                         elif result == "leaderboard":
                             show_leaderboard(screen)
                         elif result == "settings":
@@ -144,110 +121,165 @@ def main_menu():
 
 
 def run_game(username):
-    """Run gameplay loop for one session."""
+    """Run gameplay sessions until the player returns to the menu."""
     pygame.mixer.music.stop()
 
-    snake_head_image, snake_body_image, food_image, pause_image, eat_sound, fail_sound = load_game_assets()
+    rotated_heads, snake_body_image, food_image, pause_image, eat_sound, fail_sound = load_game_assets()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    countdown(screen)
-
-    snake = Snake()
-    food = Food()
-    special_food = None
-    special_spawn_timer = pygame.time.get_ticks()
-    special_particles = []
-    score = 0
-    clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 36)
-    failed = False
-    current_fps = int(10 + settings.game_speed * 20)
-    is_paused = False
-    pause_button_rect = pygame.Rect(WIDTH - 60, 20, 40, 40)
 
     while True:
-        current_time = pygame.time.get_ticks()
-        if special_food is None and current_time - special_spawn_timer >= 4000:
-            special_food = SpecialFood(food_image)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if not is_paused:
-                    if event.key == pygame.K_RIGHT:
-                        snake.new_direction = "RIGHT"
-                    elif event.key == pygame.K_LEFT:
-                        snake.new_direction = "LEFT"
-                    elif event.key == pygame.K_UP:
-                        snake.new_direction = "UP"
-                    elif event.key == pygame.K_DOWN:
-                        snake.new_direction = "DOWN"
-                if event.key in (pygame.K_p, pygame.K_SPACE):
+        countdown(screen)
+
+        snake = Snake()
+        food = Food()
+        special_food = None
+        special_spawn_timer = pygame.time.get_ticks()
+        special_particles = []
+        score = 0
+        clock = pygame.time.Clock()
+        font = get_font(36)
+        last_score = None
+        score_surface = None
+        failed = False
+        current_fps = int(10 + settings.game_speed * 20)
+        is_paused = False
+        last_eat_sound_time = -1000
+        pause_button_rect = pygame.Rect(WIDTH - 60, 20, 40, 40)
+        previous_dynamic_rects = []
+        full_redraw = True
+
+        screen_blit = screen.blit
+        get_ticks = pygame.time.get_ticks
+        tick = clock.tick
+        background = get_background()
+
+        while True:
+            current_time = get_ticks()
+            if special_food is None and current_time - special_spawn_timer >= 4000:
+                special_food = SpecialFood(food_image)
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                if event.type == pygame.KEYDOWN:
+                    if not is_paused:
+                        if event.key == pygame.K_RIGHT:
+                            snake.new_direction = "RIGHT"
+                        elif event.key == pygame.K_LEFT:
+                            snake.new_direction = "LEFT"
+                        elif event.key == pygame.K_UP:
+                            snake.new_direction = "UP"
+                        elif event.key == pygame.K_DOWN:
+                            snake.new_direction = "DOWN"
+                    if event.key in (pygame.K_p, pygame.K_SPACE):
+                        is_paused = True
+                if event.type == pygame.MOUSEBUTTONDOWN and pause_button_rect.collidepoint(event.pos):
                     is_paused = True
-            if event.type == pygame.MOUSEBUTTONDOWN and pause_button_rect.collidepoint(event.pos):
-                is_paused = True
-
-        if is_paused:
-            result = pause_menu(screen)
-            if result == "resume":
-                countdown(screen)
-                is_paused = False
-            elif result == "menu":
-                main_menu()
-                return
-
-        snake.move()
-        head = snake.head
-
-        if head == food.position:
-            snake.grow = True
-            food.spawn()
-            food.create_particles()
-            score += 10
-            eat_sound.play()
-
-        if special_food is not None:
-            head_rect = pygame.Rect(snake.head[0], snake.head[1], GRID_SIZE, GRID_SIZE)
-            if head_rect.colliderect(special_food.get_rect()):
-                snake.grow = True
-                score += special_food.points
-                eat_sound.play()
-                special_food.create_particles()
-                special_particles = special_food.particles[:]
-                special_food = None
-                special_spawn_timer = current_time
-
-        if special_particles:
-            update_special_particles(special_particles)
-
-        if head[0] < 0 or head[0] >= WIDTH or head[1] < 0 or head[1] >= HEIGHT:
-            if not failed:
-                fail_sound.play()
-                failed = True
-            break
-        if head in snake.body:
-            if not failed:
-                fail_sound.play()
-                failed = True
-            break
 
-        draw_modern_background(screen)
-        screen.blit(food_image, (food.position[0], food.position[1]))
-        food.update_particles()
-        draw_food_particles(screen, food.particles)
-
-        if special_food is not None:
-            special_food.update()
-            special_food.draw(screen)
-        if special_particles:
-            draw_food_particles(screen, special_particles)
-
-        draw_snake(screen, snake, snake_head_image, snake_body_image)
-        screen.blit(pause_image, (WIDTH - 60, 20))
-        score_text = font.render(f"Score: {score}", True, TEXT_COLOR)
-        screen.blit(score_text, (10, 10))
-        pygame.display.flip()
-        clock.tick(current_fps)
-
-    handle_game_over(screen, score, username)
+            if is_paused:
+                result = pause_menu(screen)
+                if result == "resume":
+                    countdown(screen)
+                    is_paused = False
+                elif result == "menu":
+                    return
+                full_redraw = True
+
+            previous_head = snake.head
+            previous_tail = snake.body[-1] if snake.body else snake.head
+            snake.move()
+            head = snake.head
+
+            if head == food.position:
+                snake.grow = True
+                food.spawn(snake.body_set | {head})
+                food.create_particles()
+                score += 10
+                if current_time - last_eat_sound_time >= 30:
+                    EAT_CHANNEL.play(eat_sound)
+                    last_eat_sound_time = current_time
+
+            if special_food is not None:
+                hx, hy = snake.head
+                sx = special_food.x
+                sy = special_food.y
+                if hx < sx + 2 * GRID_SIZE and hx + GRID_SIZE > sx and hy < sy + GRID_SIZE and hy + GRID_SIZE > sy:
+                    snake.grow = True
+                    score += special_food.points
+                    if current_time - last_eat_sound_time >= 30:
+                        EAT_CHANNEL.play(eat_sound)
+                        last_eat_sound_time = current_time
+                    special_food.create_particles()
+                    special_particles = special_food.particles
+                    special_food = None
+                    special_spawn_timer = current_time
+
+            if not (0 <= head[0] < WIDTH and 0 <= head[1] < HEIGHT):
+                if not failed:
+                    FAIL_CHANNEL.play(fail_sound)
+                    failed = True
+                break
+            if head in snake.body_set:
+                if not failed:
+                    FAIL_CHANNEL.play(fail_sound)
+                    failed = True
+                break
+
+            screen_blit(background, (0, 0))
+            screen_blit(food_image, (food.position[0], food.position[1]))
+            if food.particles:
+                food.particles = advance_and_draw_particles(screen, food.particles)
+
+            if special_food is not None:
+                special_food.update()
+                special_food.draw(screen)
+            if special_particles:
+                special_particles = advance_and_draw_particles(screen, special_particles)
+
+            draw_snake(screen, snake, rotated_heads, snake_body_image)
+            screen_blit(pause_image, (WIDTH - 60, 20))
+            score_changed = score != last_score
+            if score_changed:
+                score_surface = font.render(f"Score: {score}", True, TEXT_COLOR).convert_alpha()
+                last_score = score
+            screen_blit(score_surface, (10, 10))
+
+            dynamic_rects = [
+                pygame.Rect(head[0], head[1], GRID_SIZE, GRID_SIZE),
+                pygame.Rect(previous_head[0], previous_head[1], GRID_SIZE, GRID_SIZE),
+                pygame.Rect(previous_tail[0], previous_tail[1], GRID_SIZE, GRID_SIZE),
+                pygame.Rect(food.position[0], food.position[1], GRID_SIZE, GRID_SIZE),
+            ]
+            for particle in food.particles:
+                radius = int(particle[4]) + 1
+                dynamic_rects.append(
+                    pygame.Rect(int(particle[0]) - radius, int(particle[1]) - radius, 2 * radius, 2 * radius)
+                )
+            for particle in special_particles:
+                radius = int(particle[4]) + 1
+                dynamic_rects.append(
+                    pygame.Rect(int(particle[0]) - radius, int(particle[1]) - radius, 2 * radius, 2 * radius)
+                )
+
+            if special_food is not None:
+                dynamic_rects.append(special_food.get_rect())
+            if score_changed:
+                dynamic_rects.append(pygame.Rect(10, 10, 250, 40))
+
+            if full_redraw:
+                pygame.display.flip()
+                full_redraw = False
+            else:
+                pygame.display.update(dynamic_rects + previous_dynamic_rects)
+            previous_dynamic_rects = dynamic_rects
+            tick(current_fps)
+
+        Leaderboard().add_score(username, score)
+        decision = game_over_screen(screen, score, username)
+        if decision == "restart":
+            continue
+        if decision == "exit":
+            pygame.quit()
+            sys.exit()
+        return
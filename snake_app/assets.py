@@ -0,0 +1,27 @@
+"""Cached loading of image and sound assets."""
+
+import pygame
+
+from snake_app.constants import ASSETS_DIR
+
+
+_image_cache = {}
+_sound_cache = {}
+
+
+def load_image(name, size):
+    """Load and scale an image asset, reusing earlier loads."""
+    key = (name, size)
+    image = _image_cache.get(key)
+    if image is None:
+        image = pygame.image.load(ASSETS_DIR / name).convert_alpha()
+        image = _image_cache[key] = pygame.transform.scale(image, size)
+    return image
+
+
+def load_sound(name):
+    """Load a sound asset, reusing earlier loads."""
+    sound = _sound_cache.get(name)
+    if sound is None:
+        sound = _sound_cache[name] = pygame.mixer.Sound(str(ASSETS_DIR / name))
+    return sound
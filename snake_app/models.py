@@ -2,6 +2,7 @@
 
 import json
 import random
+from collections import deque
 from datetime import datetime
 
 import pygame
@@ -9,6 +10,95 @@ import pygame
 from snake_app.constants import FOOD_COLOR, GRID_SIZE, HEIGHT, LEADERBOARD_FILE, WIDTH
 
 
+_MAX_PARTICLE_RADIUS = 6
+_particle_sprites = None
+
+
+def _build_particle_sprites():
+    """Render one circle sprite per particle radius."""
+    sprites = [None]
+    for radius in range(1, _MAX_PARTICLE_RADIUS + 1):
+        sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, FOOD_COLOR, (radius, radius), radius)
+        sprites.append(sprite.convert_alpha())
+    return sprites
+
+
+def draw_particles(surface, particles):
+    """Draw particle bursts by blitting pre-rendered circle sprites."""
+    global _particle_sprites
+    if _particle_sprites is None:
+        _particle_sprites = _build_particle_sprites()
+    sprites = _particle_sprites
+    for particle in particles:
+        radius = min(int(particle[4]), _MAX_PARTICLE_RADIUS)
+        if radius > 0:
+            surface.blit(sprites[radius], (int(particle[0]) - radius, int(particle[1]) - radius))
+
+
+def advance_and_draw_particles(surface, particles):
+    """Advance particles one step, draw the survivors, and return them."""
+    global _particle_sprites
+    if _particle_sprites is None:
+        _particle_sprites = _build_particle_sprites()
+    sprites = _particle_sprites
+    alive = []
+    keep = alive.append
+    blit = surface.blit
+    for particle in particles:
+        particle[0] += particle[2]
+        particle[1] += particle[3]
+        particle[4] -= 0.1
+        life = particle[4]
+        if life > 0:
+            keep(particle)
+            radius = min(int(life), _MAX_PARTICLE_RADIUS)
+            if radius > 0:
+                blit(sprites[radius], (int(particle[0]) - radius, int(particle[1]) - radius))
+    return alive
+
+
+def advance_particles(particles):
+    """Advance particle motion one step and return the survivors."""
+    alive = []
+    keep = alive.append
+    for particle in particles:
+        particle[0] += particle[2]
+        particle[1] += particle[3]
+        particle[4] -= 0.1
+        if particle[4] > 0:
+            keep(particle)
+    return alive
+
+
+_OPPOSITE_DIRECTION = {"RIGHT": "LEFT", "LEFT": "RIGHT", "UP": "DOWN", "DOWN": "UP"}
+_DIRECTION_DELTA = {
+    "RIGHT": (GRID_SIZE, 0),
+    "LEFT": (-GRID_SIZE, 0),
+    "UP": (0, -GRID_SIZE),
+    "DOWN": (0, GRID_SIZE),
+}
+
+_FORBIDDEN_PAUSE = pygame.Rect(WIDTH - 60, 20, 40, 40)
+_FORBIDDEN_SCORE = pygame.Rect(0, 0, 150, 50)
+
+
+def _spawn_cells(max_x, max_y, cell_width):
+    """List grid cells clear of the score and pause UI areas."""
+    cells = []
+    for x in range(0, max_x, GRID_SIZE):
+        for y in range(0, max_y, GRID_SIZE):
+            cell = pygame.Rect(x, y, cell_width, GRID_SIZE)
+            if cell.colliderect(_FORBIDDEN_PAUSE) or cell.colliderect(_FORBIDDEN_SCORE):
+                continue
+            cells.append((x, y))
+    return cells
+
+
+_FOOD_CELLS = _spawn_cells(WIDTH, HEIGHT, GRID_SIZE)
+_SPECIAL_FOOD_CELLS = _spawn_cells(WIDTH - 2 * GRID_SIZE, HEIGHT - GRID_SIZE, 2 * GRID_SIZE)
+
+
 class Leaderboard:
     """Store top scores on disk."""
 
@@ -55,60 +145,51 @@ class Leaderboard:
 class Snake:
     """Runtime snake state and movement rules."""
 
+    __slots__ = ("head", "body", "body_set", "direction", "new_direction", "grow")
+
     def __init__(self):
-        self.head = [WIDTH // 2, HEIGHT // 2]
-        self.body = []
+        self.head = (WIDTH // 2, HEIGHT // 2)
+        self.body = deque()
+        self.body_set = set()
         self.direction = "RIGHT"
         self.new_direction = "RIGHT"
         self.grow = False
 
     def move(self):
         """Move one grid step while blocking instant reversal."""
-        if self.new_direction == "RIGHT" and self.direction != "LEFT":
-            self.direction = "RIGHT"
-        if self.new_direction == "LEFT" and self.direction != "RIGHT":
-            self.direction = "LEFT"
-        if self.new_direction == "UP" and self.direction != "DOWN":
-            self.direction = "UP"
-        if self.new_direction == "DOWN" and self.direction != "UP":
-            self.direction = "DOWN"
-
-        self.body.insert(0, self.head.copy())
+        if self.new_direction != _OPPOSITE_DIRECTION[self.direction]:
+            self.direction = self.new_direction
+
+        self.body.appendleft(self.head)
+        self.body_set.add(self.head)
         if not self.grow:
-            self.body.pop()
+            tail = self.body.pop()
+            self.body_set.discard(tail)
         else:
             self.grow = False
 
-        if self.direction == "RIGHT":
-            self.head[0] += GRID_SIZE
-        elif self.direction == "LEFT":
-            self.head[0] -= GRID_SIZE
-        elif self.direction == "UP":
-            self.head[1] -= GRID_SIZE
-        elif self.direction == "DOWN":
-            self.head[1] += GRID_SIZE
+        dx, dy = _DIRECTION_DELTA[self.direction]
+        self.head = (self.head[0] + dx, self.head[1] + dy)
 
 
 class Food:
     """Normal food pickup and its particles."""
 
+    __slots__ = ("position", "particles")
+
     def __init__(self):
-        self.position = [0, 0]
+        self.position = (0, 0)
         self.particles = []
         self.spawn()
 
-    def spawn(self):
-        """Spawn food away from score and pause UI areas."""
-        forbidden_pause = pygame.Rect(WIDTH - 60, 20, 40, 40)
-        forbidden_score = pygame.Rect(0, 0, 150, 50)
-        while True:
-            x = random.randrange(0, WIDTH, GRID_SIZE)
-            y = random.randrange(0, HEIGHT, GRID_SIZE)
-            food_rect = pygame.Rect(x, y, GRID_SIZE, GRID_SIZE)
-            if food_rect.colliderect(forbidden_pause) or food_rect.colliderect(forbidden_score):
-                continue
-            self.position = [x, y]
-            return
+    def spawn(self, occupied=None):
+        """Spawn food away from UI areas and any occupied cells."""
+        if occupied:
+            free_cells = [cell for cell in _FOOD_CELLS if cell not in occupied]
+            if free_cells:
+                self.position = random.choice(free_cells)
+                return
+        self.position = random.choice(_FOOD_CELLS)
 
     def create_particles(self):
         """Create burst particles at current food position."""
@@ -125,22 +206,21 @@ class Food:
 
     def update_particles(self):
         """Advance and expire food particles."""
-        for particle in self.particles[:]:
-            particle[0] += particle[2]
-            particle[1] += particle[3]
-            particle[4] -= 0.1
-            if particle[4] <= 0:
-                self.particles.remove(particle)
+        self.particles = advance_particles(self.particles)
 
 
 class SpecialFood:
     """Special two-cell food that moves and scores double."""
 
+    __slots__ = ("food_image1", "food_image2", "dx", "dy", "points", "particles", "x", "y")
+
     def __init__(self, food_image):
         self.food_image1 = food_image.copy()
         self.food_image2 = food_image.copy()
         self.food_image1.fill((0, 255, 0), special_flags=pygame.BLEND_MULT)
         self.food_image2.fill((255, 255, 0), special_flags=pygame.BLEND_MULT)
+        self.food_image1 = self.food_image1.convert_alpha()
+        self.food_image2 = self.food_image2.convert_alpha()
         self.dx = random.choice([-5, -4, 4, 5])
         self.dy = random.choice([-5, -4, 4, 5])
         self.points = 20
@@ -149,17 +229,7 @@ class SpecialFood:
 
     def spawn(self):
         """Spawn special food away from score and pause UI areas."""
-        forbidden_pause = pygame.Rect(WIDTH - 60, 20, 40, 40)
-        forbidden_score = pygame.Rect(0, 0, 150, 50)
-        while True:
-            x = random.randrange(0, WIDTH - 2 * GRID_SIZE, GRID_SIZE)
-            y = random.randrange(0, HEIGHT - GRID_SIZE, GRID_SIZE)
-            special_rect = pygame.Rect(x, y, 2 * GRID_SIZE, GRID_SIZE)
-            if special_rect.colliderect(forbidden_pause) or special_rect.colliderect(forbidden_score):
-                continue
-            self.x = x
-            self.y = y
-            return
+        self.x, self.y = random.choice(_SPECIAL_FOOD_CELLS)
 
     def update(self):
         """Move special food and bounce off blocked areas."""
@@ -172,9 +242,7 @@ class SpecialFood:
             self.dy = -self.dy
             self.y += self.dy
 
-        forbidden_pause = pygame.Rect(WIDTH - 60, 20, 40, 40)
-        forbidden_score = pygame.Rect(0, 0, 150, 50)
-        if self.get_rect().colliderect(forbidden_pause) or self.get_rect().colliderect(forbidden_score):
+        if self.get_rect().colliderect(_FORBIDDEN_PAUSE) or self.get_rect().colliderect(_FORBIDDEN_SCORE):
             self.dx = -self.dx
             self.dy = -self.dy
             self.x += self.dx
@@ -204,14 +272,8 @@ class SpecialFood:
 
     def update_particles(self):
         """Advance and expire special food particles."""
-        for particle in self.particles[:]:
-            particle[0] += particle[2]
-            particle[1] += particle[3]
-            particle[4] -= 0.1
-            if particle[4] <= 0:
-                self.particles.remove(particle)
+        self.particles = advance_particles(self.particles)
 
     def draw_particles(self, surface):
         """Draw special food particles to screen."""
-        for particle in self.particles:
-            pygame.draw.circle(surface, FOOD_COLOR, (int(particle[0]), int(particle[1])), int(particle[4]))
+        draw_particles(surface, self.particles)
@@ -4,125 +4,142 @@ import sys
 
 import pygame
 
-from snake_app.constants import ASSETS_DIR, HEIGHT, TEXT_COLOR, WIDTH
+from snake_app.assets import load_sound
+from snake_app.constants import HEIGHT, TEXT_COLOR, WIDTH
 from snake_app.models import Leaderboard
 from snake_app.settings import save_settings, set_game_speed, set_sound_volume
 import snake_app.settings as settings
-from snake_app.ui import Button, Slider, draw_modern_background, draw_text
+from snake_app.ui import Button, Slider, draw_modern_background, draw_text, get_font
+
+
+CURSOR_BLINK_EVENT = pygame.USEREVENT + 1
 
 
 def countdown(screen):
     """Display countdown before gameplay starts or resumes."""
     clock = pygame.time.Clock()
-    countdown_sound = pygame.mixer.Sound(str(ASSETS_DIR / "countdown.wav"))
+    countdown_sound = load_sound("countdown.wav")
     countdown_sound.set_volume(settings.sound_volume)
     countdown_sound.play()
 
+    font = get_font(100)
+    labels = {}
+    for label in ("3", "2", "1", "Go!"):
+        label_surface = font.render(label, True, TEXT_COLOR).convert_alpha()
+        labels[label] = (label_surface, label_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+
     start_time = pygame.time.get_ticks()
     duration = 3000
     go_displayed = False
+    shown_label = None
 
     while True:
         current_time = pygame.time.get_ticks()
         elapsed = current_time - start_time
-        draw_modern_background(screen)
 
         if elapsed < duration:
-            seconds_left = 3 - int(elapsed / 1000)
-            draw_text(screen, str(seconds_left), 100, TEXT_COLOR, WIDTH // 2, HEIGHT // 2)
+            label = str(3 - int(elapsed / 1000))
         elif not go_displayed:
-            draw_text(screen, "Go!", 100, TEXT_COLOR, WIDTH // 2, HEIGHT // 2)
+            label = "Go!"
             go_displayed = True
-            go_start = pygame.time.get_ticks()
+            go_start = current_time
         else:
-            if pygame.time.get_ticks() - go_start >= 1000:
+            if current_time - go_start >= 1000:
                 return
-            draw_text(screen, "Go!", 100, TEXT_COLOR, WIDTH // 2, HEIGHT // 2)
+            label = "Go!"
+
+        if label != shown_label:
+            draw_modern_background(screen)
+            label_surface, label_rect = labels[label]
+            screen.blit(label_surface, label_rect)
+            pygame.display.flip()
+            shown_label = label
 
-        pygame.display.flip()
         clock.tick(30)
 
 
 def username_input(screen):
     """Collect username before starting gameplay."""
-    clock = pygame.time.Clock()
     input_box = pygame.Rect(WIDTH // 2 - 150, HEIGHT // 2 - 30, 300, 60)
     base_color = pygame.Color("lightskyblue3")
     active_color = pygame.Color("dodgerblue2")
     color = base_color
     active = False
     text = ""
-    font = pygame.font.Font(None, 48)
+    font = get_font(48)
     placeholder = "Enter your username"
-    blink_time = 0
     cursor_visible = True
 
     back_button = Button(WIDTH // 2 - 50, HEIGHT - 80, 100, 50, "Back", lambda: "back")
+    clock = pygame.time.Clock()
+    pygame.time.set_timer(CURSOR_BLINK_EVENT, 500)
+
+    try:
+        while True:
+            events = [pygame.event.wait(100)]
+            events.extend(pygame.event.get())
+            for event in events:
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                if event.type == CURSOR_BLINK_EVENT:
+                    cursor_visible = not cursor_visible
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if back_button.rect.collidepoint(event.pos):
+                        return "back"
+                    active = input_box.collidepoint(event.pos)
+                    color = active_color if active else base_color
+                elif event.type == pygame.KEYDOWN and active:
+                    if event.key == pygame.K_RETURN:
+                        return text.strip() if text.strip() else "Player"
+                    if event.key == pygame.K_BACKSPACE:
+                        text = text[:-1]
+                    else:
+                        text += event.unicode
+
+            draw_modern_background(screen)
+            draw_text(screen, "Welcome", 60, TEXT_COLOR, WIDTH // 2, HEIGHT // 2 - 100)
+
+            if text == "" and not active:
+                text_surface = font.render(placeholder, True, (180, 180, 180))
+            else:
+                text_surface = font.render(text, True, TEXT_COLOR)
+
+            input_box.w = max(300, text_surface.get_width() + 20)
+            pygame.draw.rect(screen, (50, 50, 50), input_box, border_radius=10)
+            pygame.draw.rect(screen, color, input_box, 2, border_radius=10)
+            screen.blit(
+                text_surface,
+                (input_box.x + 10, input_box.y + (input_box.height - text_surface.get_height()) / 2),
+            )
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if back_button.rect.collidepoint(event.pos):
-                    return "back"
-                active = input_box.collidepoint(event.pos)
-                color = active_color if active else base_color
-            elif event.type == pygame.KEYDOWN and active:
-                if event.key == pygame.K_RETURN:
-                    return text.strip() if text.strip() else "Player"
-                if event.key == pygame.K_BACKSPACE:
-                    text = text[:-1]
-                else:
-                    text += event.unicode
-
-        blink_time += clock.get_time()
-        if blink_time > 500:
-            blink_time = 0
-            cursor_visible = not cursor_visible
-
-        draw_modern_background(screen)
-        draw_text(screen, "Welcome", 60, TEXT_COLOR, WIDTH // 2, HEIGHT // 2 - 100)
-
-        if text == "" and not active:
-            text_surface = font.render(placeholder, True, (180, 180, 180))
-        else:
-            text_surface = font.render(text, True, TEXT_COLOR)
-
-        input_box.w = max(300, text_surface.get_width() + 20)
-        pygame.draw.rect(screen, (50, 50, 50), input_box, border_radius=10)
-        pygame.draw.rect(screen, color, input_box, 2, border_radius=10)
-        screen.blit(
-            text_surface,
-            (input_box.x + 10, input_box.y + (input_box.height - text_surface.get_height()) / 2),
-        )
-
-        if active and cursor_visible:
-            cursor_x = input_box.x + 10 + text_surface.get_width() + 2
-            pygame.draw.line(
-                screen,
+            if active and cursor_visible:
+                cursor_x = input_box.x + 10 + text_surface.get_width() + 2
+                pygame.draw.line(
+                    screen,
+                    TEXT_COLOR,
+                    (cursor_x, input_box.y + 10),
+                    (cursor_x, input_box.y + input_box.height - 10),
+                    2,
+                )
+
+            instruction_surface = get_font(32).render(
+                "Press ENTER to continue",
+                True,
                 TEXT_COLOR,
-                (cursor_x, input_box.y + 10),
-                (cursor_x, input_box.y + input_box.height - 10),
-                2,
+            )
+            screen.blit(
+                instruction_surface,
+                (WIDTH // 2 - instruction_surface.get_width() // 2, input_box.y + input_box.height + 20),
             )
 
-        instruction_surface = pygame.font.Font(None, 32).render(
-            "Press ENTER to continue",
-            True,
-            TEXT_COLOR,
-        )
-        screen.blit(
-            instruction_surface,
-            (WIDTH // 2 - instruction_surface.get_width() // 2, input_box.y + input_box.height + 20),
-        )
-
-        mouse_pos = pygame.mouse.get_pos()
-        back_button.hovered = back_button.rect.collidepoint(mouse_pos)
-        back_button.draw(screen)
-        pygame.display.flip()
-        clock.tick(30)
+            mouse_pos = pygame.mouse.get_pos()
+            back_button.hovered = back_button.rect.collidepoint(mouse_pos)
+            back_button.draw(screen)
+            pygame.display.flip()
+            clock.tick(30)
+    finally:
+        pygame.time.set_timer(CURSOR_BLINK_EVENT, 0)
 
 
 def settings_menu(screen):
@@ -144,21 +161,34 @@ def settings_menu(screen):
         label="Game Speed",
     )
     back_button = Button(WIDTH // 2 - 100, 400, 200, 50, "Back", lambda: "back")
+    unsaved_changes = False
+    last_save_time = pygame.time.get_ticks()
 
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if unsaved_changes:
+                    save_settings()
                 pygame.quit()
                 sys.exit()
             slider_sound.handle_event(event)
             slider_speed.handle_event(event)
             if event.type == pygame.MOUSEBUTTONDOWN and back_button.rect.collidepoint(event.pos):
+                if unsaved_changes:
+                    save_settings()
                 return
 
-        set_sound_volume(slider_sound.value)
-        set_game_speed(slider_speed.value)
-        pygame.mixer.music.set_volume(settings.sound_volume)
-        save_settings()
+        if slider_sound.value != settings.sound_volume or slider_speed.value != settings.game_speed:
+            set_sound_volume(slider_sound.value)
+            set_game_speed(slider_speed.value)
+            pygame.mixer.music.set_volume(settings.sound_volume)
+            unsaved_changes = True
+
+        current_time = pygame.time.get_ticks()
+        if unsaved_changes and current_time - last_save_time >= 500:
+            save_settings()
+            unsaved_changes = False
+            last_save_time = current_time
 
         draw_modern_background(screen)
         draw_text(screen, "Settings", 64, TEXT_COLOR, WIDTH // 2, 100)
@@ -177,7 +207,7 @@ def show_leaderboard(screen):
     leaderboard = Leaderboard()
     back_button = Button(WIDTH // 2 - 100, HEIGHT - 80, 200, 50, "Back", lambda: None)
 
-    button_font = pygame.font.Font(None, 36)
+    button_font = get_font(36)
     clear_text_surface = button_font.render("Clear Leaderboard", True, TEXT_COLOR)
     clear_button = Button(
         WIDTH // 2 - (clear_text_surface.get_width() + 20) // 2,
@@ -188,15 +218,23 @@ def show_leaderboard(screen):
         lambda: "clear",
     )
 
-    while True:
-        draw_modern_background(screen)
-        draw_text(screen, "Leaderboard", 64, TEXT_COLOR, WIDTH // 2, 50)
-
+    def build_entries():
+        title_surface = get_font(64).render("Leaderboard", True, TEXT_COLOR).convert_alpha()
+        entries = [(title_surface, title_surface.get_rect(center=(WIDTH // 2, 50)))]
+        entry_font = get_font(32)
         y = 120
         for index, entry in enumerate(leaderboard.scores[:10]):
             line = f"{index + 1}. {entry['username']} - {entry['score']} ({entry['date']})"
-            draw_text(screen, line, 32, TEXT_COLOR, WIDTH // 2, y)
+            line_surface = entry_font.render(line, True, TEXT_COLOR).convert_alpha()
+            entries.append((line_surface, line_surface.get_rect(center=(WIDTH // 2, y))))
             y += 50
+        return entries
+
+    score_entries = build_entries()
+
+    while True:
+        draw_modern_background(screen)
+        screen.blits(score_entries)
 
         mouse_pos = pygame.mouse.get_pos()
         clear_button.hovered = clear_button.rect.collidepoint(mouse_pos)
@@ -210,10 +248,11 @@ def show_leaderboard(screen):
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if clear_button.rect.collidepoint(event.pos):
+                if clear_button.hovered:
                     leaderboard.scores = []
                     leaderboard.save()
-                elif back_button.rect.collidepoint(event.pos):
+                    score_entries = build_entries()
+                elif back_button.hovered:
                     return
 
 
@@ -224,26 +263,39 @@ def game_over_screen(screen, score, username):
     restart_button = Button(330, HEIGHT // 2 + 50, 140, 50, "Restart", lambda: "restart")
     exit_button = Button(490, HEIGHT // 2 + 50, 140, 50, "Exit", lambda: "exit")
 
+    title_surface = get_font(64).render("Game Over", True, TEXT_COLOR).convert_alpha()
+    title_rect = title_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 100))
+    score_surface = get_font(48).render(f"Score: {score}", True, TEXT_COLOR).convert_alpha()
+    score_rect = score_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+    full_redraw = True
+
     while True:
         draw_modern_background(screen)
-        draw_text(screen, "Game Over", 64, TEXT_COLOR, WIDTH // 2, HEIGHT // 2 - 100)
-        draw_text(screen, f"Score: {score}", 48, TEXT_COLOR, WIDTH // 2, HEIGHT // 2 - 30)
+        screen.blit(title_surface, title_rect)
+        screen.blit(score_surface, score_rect)
         mouse_pos = pygame.mouse.get_pos()
+        dirty_rects = []
         for button in (main_menu_button, restart_button, exit_button):
             button.hovered = button.rect.collidepoint(mouse_pos)
+            previous_rect = button.rect.copy()
             button.draw(screen)
-        pygame.display.flip()
+            dirty_rects.append(previous_rect.union(button.rect))
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty_rects)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if main_menu_button.rect.collidepoint(event.pos):
+                if main_menu_button.hovered:
                     return "main_menu"
-                if restart_button.rect.collidepoint(event.pos):
+                if restart_button.hovered:
                     return "restart"
-                if exit_button.rect.collidepoint(event.pos):
+                if exit_button.hovered:
                     return "exit"
 
 
@@ -252,6 +304,12 @@ def pause_menu(screen):
     resume_button = Button(WIDTH // 2 - 100, HEIGHT // 2 - 50, 200, 50, "Resume", lambda: "resume")
     menu_button = Button(WIDTH // 2 - 100, HEIGHT // 2 + 50, 200, 50, "Main Menu", lambda: "menu")
 
+    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+    overlay.fill((0, 0, 0, 128))
+
+    paused_surface = get_font(100).render("PAUSED", True, TEXT_COLOR).convert_alpha()
+    paused_rect = paused_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 150))
+
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -265,11 +323,9 @@ def pause_menu(screen):
                 if menu_button.rect.collidepoint(event.pos):
                     return "menu"
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
 
-        draw_text(screen, "PAUSED", 100, TEXT_COLOR, WIDTH // 2, HEIGHT // 2 - 150)
+        screen.blit(paused_surface, paused_rect)
         mouse_pos = pygame.mouse.get_pos()
         resume_button.hovered = resume_button.rect.collidepoint(mouse_pos)
         menu_button.hovered = menu_button.rect.collidepoint(mouse_pos)
@@ -304,21 +360,18 @@ def how_to_play_screen(screen):
     line_spacing = int(base_font_size * 1.2)
     start_y = (HEIGHT - len(instructions) * line_spacing) // 2
 
+    title_surface = get_font(int(base_font_size * 1.5)).render("How to Play", True, TEXT_COLOR).convert_alpha()
+    title_rect = title_surface.get_rect(center=(WIDTH // 2, start_y - line_spacing - 10))
+    line_font = get_font(base_font_size)
+    static_text = [(title_surface, title_rect)]
+    for index, line in enumerate(instructions):
+        line_surface = line_font.render(line, True, TEXT_COLOR).convert_alpha()
+        line_rect = line_surface.get_rect(center=(WIDTH // 2, start_y + index * line_spacing))
+        static_text.append((line_surface, line_rect))
+
     while True:
         draw_modern_background(screen)
-        draw_text(
-            screen,
-            "How to Play",
-            int(base_font_size * 1.5),
-            TEXT_COLOR,
-            WIDTH // 2,
-            start_y - line_spacing - 10,
-        )
-
-        y = start_y
-        for line in instructions:
-            draw_text(screen, line, base_font_size, TEXT_COLOR, WIDTH // 2, y)
-            y += line_spacing
+        screen.blits(static_text)
 
         mouse_pos = pygame.mouse.get_pos()
         back_button.hovered = back_button.rect.collidepoint(mouse_pos)
@@ -329,5 +382,5 @@ def how_to_play_screen(screen):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN and back_button.rect.collidepoint(event.pos):
+            if event.type == pygame.MOUSEBUTTONDOWN and back_button.hovered:
                 return
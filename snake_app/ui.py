@@ -5,8 +5,23 @@ import pygame
 from snake_app.constants import BUTTON_COLOR, BUTTON_HOVER, HEIGHT, TEXT_COLOR, WIDTH
 
 
-def draw_modern_background(surface):
-    """Draw the menu and gameplay gradient background."""
+_font_cache = {}
+
+
+def get_font(size):
+    """Return a shared default font for the given size."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.Font(None, size)
+    return font
+
+
+_background_cache = None
+
+
+def _build_background():
+    """Render the gradient once into an offscreen surface."""
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
     top_color = (30, 30, 60)
     bottom_color = (10, 10, 40)
     for y in range(HEIGHT):
@@ -14,12 +29,26 @@ def draw_modern_background(surface):
         red = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
         green = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
         blue = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(surface, (red, green, blue), (0, y), (WIDTH, y))
+        pygame.draw.line(background, (red, green, blue), (0, y), (WIDTH, y))
+    return background
+
+
+def get_background():
+    """Return the cached gradient background surface."""
+    global _background_cache
+    if _background_cache is None:
+        _background_cache = _build_background()
+    return _background_cache
+
+
+def draw_modern_background(surface):
+    """Draw the menu and gameplay gradient background."""
+    surface.blit(get_background(), (0, 0))
 
 
 def draw_text(surface, text, size, color, x, y):
     """Render centered text on the target surface."""
-    font = pygame.font.Font(None, size)
+    font = get_font(size)
     text_surface = font.render(text, True, color)
     text_rect = text_surface.get_rect(center=(x, y))
     surface.blit(text_surface, text_rect)
@@ -35,6 +64,7 @@ class Button:
         self.callback = callback
         self.hovered = False
         self.current_scale = 1.0
+        self._text_surface = None
 
     def draw(self, surface):
         """Draw button state on screen."""
@@ -47,10 +77,10 @@ class Button:
         self.rect = pygame.Rect(new_x, new_y, new_width, new_height)
         color = BUTTON_HOVER if self.hovered else BUTTON_COLOR
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(self.text, True, TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if self._text_surface is None:
+            self._text_surface = get_font(36).render(self.text, True, TEXT_COLOR).convert_alpha()
+        text_rect = self._text_surface.get_rect(center=self.rect.center)
+        surface.blit(self._text_surface, text_rect)
 
 
 class Slider:
@@ -69,7 +99,7 @@ class Slider:
         pygame.draw.line(surface, (150, 150, 150), (self.x, self.y), (self.x + self.width, self.y), 4)
         knob_x = self.x + int(self.value * self.width)
         pygame.draw.circle(surface, (200, 200, 200), (knob_x, self.y), 10)
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         label_text = f"{self.label}: {int(self.value * 100)}%"
         text_surface = font.render(label_text, True, TEXT_COLOR)
         text_rect = text_surface.get_rect(midtop=(self.x + self.width / 2, self.y + 20))
@@ -78,9 +108,9 @@ class Slider:
     def handle_event(self, event):
         """Update slider state while dragging the knob."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_x, mouse_y = event.pos
             knob_x = self.x + int(self.value * self.width)
-            if (mouse_x - knob_x) ** 2 + (mouse_y - self.y) ** 2 <= 10 ** 2:
+            knob_rect = pygame.Rect(knob_x - 10, self.y - 10, 20, 20)
+            if knob_rect.collidepoint(event.pos):
                 self.dragging = True
         elif event.type == pygame.MOUSEBUTTONUP:
             self.dragging = False